@@ -4,7 +4,9 @@ Module for safely retrieving values from
 a dictionary with a default fallback
 """
 
-from typing import Mapping, TypeVar, Any, Union
+from itertools import repeat
+from typing import (Any, Iterable, Iterator, List, Mapping, Optional,
+                    TypeVar, Union)
 
 # Define a TypeVar to represent the type of the default value
 T = TypeVar('T')
@@ -34,3 +36,72 @@ def safely_get_value(
         return dct[key]
     else:
         return default
+
+
+def safely_get_values(
+                          dct: Mapping,
+                          keys: Iterable[Any],
+                          default: Union[T, None] = None,
+                          lazy: bool = False
+                          ) -> Union[List[Union[Any, T]],
+                                     Iterator[Union[Any, T]]]:
+    """
+    Safely get the values of many keys, with one lookup per key.
+
+    Args:
+    dct (Mapping[Any, Any]): A mapping (e.g., dictionary) from
+    which to get the values.
+    keys (Iterable[Any]): The keys whose values are to be returned.
+    default (Union[T, None], optional): The value used for every
+    missing key. Defaults to None.
+    lazy (bool, optional): Return an iterator instead of a list.
+
+    Returns:
+    Union[List, Iterator]: The value, or default, for each key in order.
+    """
+    values = map(dct.get, keys, repeat(default))
+    return values if lazy else list(values)
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> Any:
+    """Rejects any attempt to modify a FrozenDict."""
+    raise TypeError("'FrozenDict' object is read-only")
+
+
+class FrozenDict(dict):
+    """
+    Read-only dict for hot lookup paths.
+
+    Being a dict, `in`, [] and get all stay in C; only the methods
+    that would modify it are blocked. The hash of the whole mapping is
+    computed once, so it can itself be used as a dict key.
+    """
+
+    __slots__ = ('_hash',)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Takes the same arguments as dict()."""
+        if hasattr(self, '_hash'):
+            _read_only(self)
+        super().__init__(*args, **kwargs)
+        self._hash: Optional[int] = None
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    update = pop = popitem = clear = setdefault = _read_only
+
+    @classmethod
+    def fromkeys(cls, iterable: Iterable[Any],
+                 value: Any = None) -> 'FrozenDict':
+        """Builds a FrozenDict mapping every key in iterable to value."""
+        return cls(dict.fromkeys(iterable, value))
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        if self._hash is None:
+            self._hash = hash(frozenset(self.items()))
+        return self._hash
+
+    def __reduce__(self) -> Any:
+        return (FrozenDict, (dict(self),))
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
@@ -1,8 +1,19 @@
 #!/usr/bin/env python3
 """
 Module providing a function to zoom (duplicate) elements in a list.
+
+Besides the list-building zoom_array, it offers a lazy ZoomView,
+iterator and chunked generator variants that never materialize the
+zoomed list, and a fast path for typed arrays.
 """
-from typing import List, Sequence, Union
+from array import array as TypedArray
+from itertools import chain, islice, repeat
+from typing import Any, Iterator, List, Sequence, Union, overload
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 def zoom_array(lst: Sequence[Union[int, float]],
@@ -27,6 +38,107 @@ def zoom_array(lst: Sequence[Union[int, float]],
     return zoomed_in
 
 
+class ZoomView(Sequence[Union[int, float]]):
+    """
+    Read-only sequence view of lst zoomed by factor.
+    Item i is computed on access as lst[i // factor].
+    """
+
+    def __init__(self, lst: Sequence[Union[int, float]],
+                 factor: int = 2) -> None:
+        """
+        Args:
+            lst (Sequence[Union[int, float]]): The sequence to zoom.
+            factor (int, optional): Duplication factor. Defaults to 2.
+        """
+        self._lst = lst
+        self._factor = factor
+
+    def __len__(self) -> int:
+        return len(self._lst) * self._factor
+
+    @overload
+    def __getitem__(self, index: int) -> Union[int, float]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Union[int, float]]:
+        ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ZoomView index out of range")
+        return self._lst[index // self._factor]
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        return zoom_iter(self._lst, self._factor)
+
+
+def zoom_iter(lst: Sequence[Union[int, float]],
+              factor: int = 2) -> Iterator[Union[int, float]]:
+    """
+    Lazily yields each element of lst `factor` times.
+
+    Args:
+        lst (Sequence[Union[int, float]]): The sequence to zoom.
+        factor (int, optional): Duplication factor. Defaults to 2.
+
+    Returns:
+        Iterator[Union[int, float]]: The zoomed elements.
+    """
+    return chain.from_iterable(repeat(item, factor) for item in lst)
+
+
+def zoom_chunks(lst: Sequence[Union[int, float]], factor: int = 2,
+                chunk_size: int = 4096
+                ) -> Iterator[List[Union[int, float]]]:
+    """
+    Yields the zoomed elements as lists of at most chunk_size items,
+    so only one chunk is held in memory at a time.
+
+    Args:
+        lst (Sequence[Union[int, float]]): The sequence to zoom.
+        factor (int, optional): Duplication factor. Defaults to 2.
+        chunk_size (int, optional): Items per chunk. Defaults to 4096.
+
+    Yields:
+        List[Union[int, float]]: The next chunk.
+    """
+    items = zoom_iter(lst, factor)
+    chunk = list(islice(items, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(items, chunk_size))
+
+
+def zoom_typed_array(arr: Any, factor: int = 2) -> Any:
+    """
+    Zooms a typed array without boxing its elements.
+
+    Args:
+        arr (array.array or numpy.ndarray): The array to zoom.
+        factor (int, optional): Duplication factor. Defaults to 2.
+
+    Returns:
+        A new array of the same type, using numpy.repeat for NumPy
+        arrays and strided slice assignment for array.array.
+    """
+    if numpy is not None and isinstance(arr, numpy.ndarray):
+        return numpy.repeat(arr, factor)
+    if not isinstance(arr, TypedArray):
+        raise TypeError("zoom_typed_array expects array.array "
+                        "or numpy.ndarray")
+    zoomed = TypedArray(arr.typecode, bytes(arr.itemsize))
+    zoomed *= len(arr) * factor
+    for offset in range(factor):
+        zoomed[offset::factor] = arr
+    return zoomed
+
+
 # Sample usage
 array = [12, 72, 91]
 zoom_2x = zoom_array(array)
@@ -2,19 +2,70 @@
 """
 This module defines a function sum_list which takes a list of floats
 as an argument and returns their sum as a float.
+
+Inputs supporting the buffer protocol (array('d'), memoryview, NumPy
+arrays) are summed in place without being copied, with NumPy when it
+is installed.
 """
 
-from typing import List
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CHUNK_SIZE = 1 << 20
+
+
+def _sum_buffer(view: memoryview, exact: bool) -> float:
+    """
+    Sums a one-dimensional memoryview without copying it.
+
+    Args:
+        view (memoryview): The numbers to add.
+        exact (bool): Use math.fsum for a correctly rounded result.
+
+    Returns:
+        float: The sum of the numbers in the view.
+    """
+    if exact:
+        return math.fsum(view)
+    if numpy is not None:
+        return float(numpy.asarray(view).sum())
+    return float(sum(view))
 
 
-def sum_list(input_list: List[float]) -> float:
+def sum_list(input_list: Sequence[float],
+             exact: bool = False,
+             workers: Optional[int] = None) -> float:
     """
     Returns the sum of a list of floats.
 
     Args:
-        input_list (List[float]): A list of float numbers.
+        input_list (Sequence[float]): A list of float numbers, or any
+        object supporting the buffer protocol.
+        exact (bool, optional): Use math.fsum, which does not lose
+        precision to rounding. Defaults to False.
+        workers (int, optional): For buffers longer than CHUNK_SIZE,
+        sum zero-copy slices on this many threads. Only used with
+        NumPy, whose reductions release the GIL; ignored when exact.
 
     Returns:
         float: The sum of the float numbers in the list.
     """
-    return sum(input_list)
+    try:
+        view = memoryview(input_list)
+    except TypeError:
+        return math.fsum(input_list) if exact else sum(input_list)
+    if view.ndim != 1:
+        view = view.cast('B').cast(view.format)
+    if exact or not workers or numpy is None or len(view) <= CHUNK_SIZE:
+        return _sum_buffer(view, exact)
+    chunks = [view[start:start + CHUNK_SIZE]
+              for start in range(0, len(view), CHUNK_SIZE)]
+    with ThreadPoolExecutor(workers) as pool:
+        return math.fsum(pool.map(_sum_buffer, chunks,
+                                  [False] * len(chunks)))
@@ -3,17 +3,23 @@
 This module defines a function sum_mixed_list which takes a list of integers
 and floats as an argument and returns their sum as a float.
 """
-from typing import List, Union
+from typing import List, Optional, Union
+sum_list = __import__('5-sum_list').sum_list
 
 
-def sum_mixed_list(mxd_lst: List[Union[int, float]]) -> float:
+def sum_mixed_list(mxd_lst: List[Union[int, float]],
+                   exact: bool = False,
+                   workers: Optional[int] = None) -> float:
     """
     Returns the sum of a list containing integers and floats.
 
     Args:
-        mxd_lst: A list of integers and float numbers.
+        mxd_lst: A list of integers and float numbers, or any
+        object supporting the buffer protocol.
+        exact (bool, optional): Use math.fsum, see sum_list.
+        workers (int, optional): Threads for large buffers, see sum_list.
 
     Returns:
         float: The sum of the numbers in the list.
     """
-    return float(sum(mxd_lst))
+    return float(sum_list(mxd_lst, exact, workers))
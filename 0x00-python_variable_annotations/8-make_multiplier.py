@@ -4,10 +4,111 @@ Module to create a multiplier function.
 from typing import Callable
 """
 
-from typing import Callable
+from array import array as TypedArray
+from numbers import Number
+from typing import Any
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
-def make_multiplier(multiplier: float) -> Callable[[float], float]:
+class Multiplier:
+    """
+    Callable that multiplies by a fixed factor.
+
+    Besides a single float it accepts sequences and float buffers
+    (array('f'/'d'), memoryviews, NumPy arrays) and multiplies them in
+    one pass, optionally in place. Composing multipliers folds their factors.
+    """
+
+    def __init__(self, multiplier: float) -> None:
+        """
+        Args:
+            multiplier (float): The value to multiply by.
+        """
+        self.multiplier = multiplier
+
+    def __repr__(self) -> str:
+        return f"Multiplier({self.multiplier!r})"
+
+    def compose(self, other: "Multiplier") -> "Multiplier":
+        """
+        Returns one Multiplier equivalent to applying self then other.
+
+        Args:
+            other (Multiplier): The multiplier applied afterwards.
+        """
+        return Multiplier(self.multiplier * other.multiplier)
+
+    def __call__(self, value: Any, in_place: bool = False) -> Any:
+        """
+        Multiplies value by the multiplier.
+
+        Args:
+            value: A number, a sequence of numbers, or a float buffer.
+            Anything that is not iterable is multiplied directly.
+            in_place (bool, optional): Write the products back into a
+            mutable value instead of returning a new one.
+
+        Returns:
+            The product, with the same type as value (lists for
+            sequences), or value itself when in_place.
+        """
+        multiplier = self.multiplier
+        if isinstance(value, Number) or not hasattr(value, '__iter__'):
+            return value * multiplier
+        if numpy is not None and isinstance(value, numpy.ndarray):
+            if in_place:
+                value *= multiplier
+                return value
+            return value * multiplier
+        if isinstance(value, TypedArray) and value.typecode in "fd":
+            if numpy is not None:
+                result = (value if in_place
+                          else TypedArray(value.typecode, value))
+                view = numpy.asarray(memoryview(result))
+                numpy.multiply(view, multiplier, out=view)
+                return result
+            result = TypedArray(value.typecode,
+                                [item * multiplier for item in value])
+            if in_place:
+                value[:] = result
+                return value
+            return result
+        if isinstance(value, memoryview):
+            if in_place and value.readonly:
+                raise TypeError("cannot multiply a read-only buffer "
+                                "in place")
+            if value.format in "fd":
+                view = (value if in_place
+                        else memoryview(TypedArray(value.format, value)))
+                if numpy is not None:
+                    result = numpy.asarray(view)
+                    numpy.multiply(result, multiplier, out=result)
+                    return view
+                view[:] = TypedArray(view.format,
+                                     [item * multiplier for item in view])
+                return view
+        products = [item * multiplier for item in value]
+        if in_place and isinstance(value, (TypedArray, memoryview)):
+            typecode = (value.format if isinstance(value, memoryview)
+                        else value.typecode)
+            try:
+                value[:] = TypedArray(typecode, products)
+            except (TypeError, ValueError):
+                raise TypeError(
+                    f"cannot store products of {multiplier!r} in place "
+                    f"in a '{typecode}' buffer") from None
+            return value
+        if in_place:
+            value[:] = products
+            return value
+        return products
+
+
+def make_multiplier(multiplier: float) -> Multiplier:
     """
     Returns a function that multiplies a float by the given multiplier.
 
@@ -15,10 +116,8 @@ def make_multiplier(multiplier: float) -> Callable[[float], float]:
         multiplier (float): The value to multiply by.
 
     Returns:
-        Callable[[float], float]: A function that takes a float and
-        returns its product with the multiplier.
+        Multiplier: A callable that takes a float and returns its
+        product with the multiplier. It also accepts sequences and
+        float buffers.
     """
-    def multiplier_function(value: float) -> float:
-        return value * multiplier
-
-    return multiplier_function
+    return Multiplier(multiplier)
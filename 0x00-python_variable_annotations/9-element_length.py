@@ -4,7 +4,8 @@
 Module for calculating the length of sequences in an iterable.
 """
 
-from typing import Iterable, Sequence, List, Tuple
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Sequence, List, Tuple
 
 
 def element_length(lst: Iterable[Sequence]) -> List[Tuple[Sequence, int]]:
@@ -21,3 +22,66 @@ def element_length(lst: Iterable[Sequence]) -> List[Tuple[Sequence, int]]:
         consists of a sequence and its length.
     """
     return [(i, len(i)) for i in lst]
+
+
+def element_length_iter(lst: Iterable[Sequence]
+                        ) -> Iterator[Tuple[Sequence, int]]:
+    """
+    Lazily yields the same (sequence, length) tuples as element_length.
+
+    Args:
+        lst (Iterable[Sequence]): An iterable of sequences.
+
+    Returns:
+        Iterator[Tuple[Sequence, int]]: The tuples, one at a time.
+    """
+    return ((i, len(i)) for i in lst)
+
+
+def element_lengths(lst: Iterable[Sequence]) -> array:
+    """
+    Takes an iterable of sequences and returns only their lengths,
+    packed in an array('q') rather than a list of tuples.
+
+    Args:
+        lst (Iterable[Sequence]): An iterable of sequences.
+
+    Returns:
+        array: The length of every sequence, in order.
+    """
+    return array('q', map(len, lst))
+
+
+def element_length_stats(lst: Iterable[Sequence]) -> Dict[str, Any]:
+    """
+    Aggregates the lengths of the sequences in O(1) memory, so lst
+    may be arbitrarily large (e.g. the lines of a file).
+
+    Args:
+        lst (Iterable[Sequence]): An iterable of sequences.
+
+    Returns:
+        Dict[str, Any]: count, sum, min and max of the lengths, and
+        a histogram mapping each power-of-two bucket lower bound
+        (0, 1, 2, 4, 8, ...) to the number of lengths falling in it.
+    """
+    count = total = 0
+    low = high = 0
+    buckets: Dict[int, int] = {}
+    for length in map(len, lst):
+        if not count or length < low:
+            low = length
+        if length > high:
+            high = length
+        count += 1
+        total += length
+        bucket = length.bit_length()
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+    return {
+        "count": count,
+        "sum": total,
+        "min": low,
+        "max": high,
+        "histogram": {(1 << bucket) >> 1: buckets[bucket]
+                      for bucket in sorted(buckets)},
+    }
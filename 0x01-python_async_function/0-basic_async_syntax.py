@@ -5,19 +5,24 @@ that waits for a random delay
 """
 import asyncio
 import random
+from typing import Any, Awaitable, Callable
 
 
-async def wait_random(max_delay: int = 10) -> float:
+async def wait_random(max_delay: int = 10,
+                      sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+                      ) -> float:
     """
     Waits for a random delay between 0 and max_delay (inclusive) seconds and
     returns the delay.
 
     Args:
         max_delay (int): The maximum delay in seconds. Default is 10.
+        sleep (Callable, optional): Sleep primitive to wait with, e.g.
+        wheel_sleep from 10-timer_wheel. Default is asyncio.sleep.
 
     Returns:
         float: The actual delay.
     """
     delay = random.uniform(0, max_delay)
-    await asyncio.sleep(delay)
+    await sleep(delay)
     return delay
@@ -4,13 +4,51 @@ This module contains an asynchronous coroutine
 that spawns multiple wait_random coroutines
 and returns the list of all delays in ascending order.
 """
-from typing import List
+from typing import AsyncIterator, List, Optional
 import asyncio
 from importlib import import_module
 wait_random = import_module('0-basic_async_syntax').wait_random
+WorkerPool = import_module('5-worker_pool').WorkerPool
+wait_n_batched = import_module('9-batched_wait').wait_n_batched
 
 
-async def wait_n(n: int, max_delay: int) -> List[float]:
+async def wait_n_iter(n: int, max_delay: int,
+                      max_in_flight: Optional[int] = None,
+                      pool: Optional[WorkerPool] = None
+                      ) -> AsyncIterator[float]:
+    """
+    Spawns wait_random n times with the specified
+    max_delay and yields each delay as soon as its
+    coroutine finishes (completion order).
+    Args:
+        n (int): Number of times to spawn wait_random.
+        max_delay (int): Maximum delay in seconds.
+        max_in_flight (int, optional): If set, run at most this many
+        coroutines at once through a WorkerPool.
+        pool (WorkerPool, optional): Run through this pool instead, so
+        the caller can read its stats(). Overrides max_in_flight.
+    Yields:
+        float: The delay of the next coroutine to finish.
+    """
+    if pool is None and max_in_flight:
+        pool = WorkerPool(max_in_flight)
+    if pool is not None:
+        async for delay in pool.imap(lambda: wait_random(max_delay), n):
+            yield delay
+        return
+    tasks = [asyncio.ensure_future(wait_random(max_delay)) for _ in range(n)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def wait_n(n: int, max_delay: int,
+                 max_in_flight: Optional[int] = None,
+                 pool: Optional[WorkerPool] = None,
+                 batched: bool = False) -> List[float]:
     """
     Spawns wait_random n times with the specified
     max_delay and returns the list of all the delays
@@ -18,13 +56,24 @@ async def wait_n(n: int, max_delay: int) -> List[float]:
     Args:
         n (int): Number of times to spawn wait_random.
         max_delay (int): Maximum delay in seconds.
+        max_in_flight (int, optional): Concurrency limit, see wait_n_iter.
+        pool (WorkerPool, optional): Pool to run through, see wait_n_iter.
+        batched (bool, optional): Draw all delays at once and share
+        timers between them instead of spawning coroutines,
+        see wait_n_batched. Cannot be combined with max_in_flight
+        or pool.
     Returns:
         List[float]: List of delays in ascending order.
+    Raises:
+        ValueError: If batched is set together with max_in_flight or
+        pool.
     """
-    delays = await asyncio.gather(*(wait_random(max_delay) for _ in range(n)))
-    sorted_delays = []
-    while delays:
-        min_delay = min(delays)
-        sorted_delays.append(min_delay)
-        delays.remove(min_delay)
-    return sorted_delays
+    if batched:
+        if max_in_flight is not None or pool is not None:
+            raise ValueError("batched cannot be combined with "
+                             "max_in_flight or pool")
+        return await wait_n_batched(n, max_delay)
+    # Completion order is already (almost) ascending, so sorted() only
+    # has to stitch a few runs together instead of doing an O(n^2) scan.
+    return sorted([delay async for delay in wait_n_iter(
+        n, max_delay, max_in_flight, pool)])
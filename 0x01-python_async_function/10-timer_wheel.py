@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Module providing a hierarchical timer wheel for very large
+numbers of concurrent sleepers.
+
+Each sleeper is appended to a slot list in O(1) instead of being
+pushed on the loop's timer heap, and the whole wheel is driven by a
+single loop timer that only fires on ticks that have work to do.
+"""
+import asyncio
+import weakref
+from typing import Any, Awaitable, List, Tuple
+
+SLOT_BITS = 8
+SLOTS = 1 << SLOT_BITS
+SLOT_MASK = SLOTS - 1
+
+_wheels: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class TimerWheel:
+    """
+    Hierarchical timer wheel bound to one event loop.
+
+    Level 0 has one slot per tick; every higher level covers SLOTS
+    times the span of the one below it and is cascaded down when the
+    lower level wraps around.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop,
+                 resolution: float = 0.001, levels: int = 4) -> None:
+        """
+        Args:
+            loop (asyncio.AbstractEventLoop): Loop that drives the wheel.
+            resolution (float, optional): Tick length in seconds.
+            Defaults to 1 ms.
+            levels (int, optional): Number of wheels. Defaults to 4,
+            which spans about 49 days at 1 ms ticks.
+        """
+        self._loop = loop
+        self.resolution = resolution
+        self.levels = levels
+        self._wheels: List[List[List[Tuple[int, asyncio.Future, Any]]]] = [
+            [[] for _ in range(SLOTS)] for _ in range(levels)
+        ]
+        self._origin = loop.time()
+        self._tick = 0
+        self._count = 0
+        self._handle: Any = None
+        self._wake_tick = 0
+
+    def __len__(self) -> int:
+        """Number of timers still in the wheel."""
+        return self._count
+
+    def _insert(self, entry: Tuple[int, asyncio.Future, Any]) -> None:
+        """Places an entry in the lowest level that can hold it."""
+        delta = entry[0] - self._tick
+        level = 0
+        while level < self.levels - 1 and delta >= 1 << (
+                SLOT_BITS * (level + 1)):
+            level += 1
+        slot = (entry[0] >> (SLOT_BITS * level)) & SLOT_MASK
+        self._wheels[level][slot].append(entry)
+
+    def _advance(self) -> None:
+        """Moves one tick forward, cascading and expiring timers."""
+        self._tick += 1
+        tick = self._tick
+        top = 1
+        while top < self.levels and not tick & (
+                (1 << (SLOT_BITS * top)) - 1):
+            top += 1
+        for level in range(top - 1, 0, -1):
+            slot = (tick >> (SLOT_BITS * level)) & SLOT_MASK
+            entries = self._wheels[level][slot]
+            self._wheels[level][slot] = []
+            for entry in entries:
+                self._insert(entry)
+        slot = tick & SLOT_MASK
+        expired = self._wheels[0][slot]
+        self._wheels[0][slot] = []
+        self._count -= len(expired)
+        for _, future, result in expired:
+            if not future.done():
+                future.set_result(result)
+
+    def _next_wake(self) -> int:
+        """Returns the next tick that expires timers or cascades."""
+        boundary = (self._tick | SLOT_MASK) + 1
+        for tick in range(self._tick + 1, boundary):
+            if self._wheels[0][tick & SLOT_MASK]:
+                return tick
+        return boundary
+
+    def _schedule(self) -> None:
+        """Arms the single loop timer for the next tick with work."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if self._count:
+            self._wake_tick = self._next_wake()
+            self._handle = self._loop.call_at(
+                self._origin + self._wake_tick * self.resolution, self._run)
+
+    def _run(self) -> None:
+        """Loop callback: catches the wheel up with the loop clock."""
+        self._handle = None
+        now = int((self._loop.time() - self._origin) / self.resolution)
+        target = max(now, self._wake_tick)
+        while self._tick < target and self._count:
+            self._advance()
+        if not self._count:
+            self._tick = max(self._tick, target)
+        self._schedule()
+
+    def sleep(self, delay: float, result: Any = None) -> Awaitable[Any]:
+        """
+        Returns a future that resolves to result after at least
+        delay seconds, rounded up to the next tick. Returning the
+        future itself avoids a coroutine frame per sleeper.
+
+        Args:
+            delay (float): Number of seconds to sleep.
+            result (Any, optional): Value the future resolves to.
+        """
+        if delay <= 0:
+            return asyncio.sleep(0, result)
+        if not self._count:
+            self._tick = max(self._tick, int(
+                (self._loop.time() - self._origin) / self.resolution))
+        deadline = max(int((self._loop.time() - self._origin + delay)
+                           / self.resolution) + 1, self._tick + 1)
+        future = self._loop.create_future()
+        self._insert((deadline, future, result))
+        self._count += 1
+        if self._handle is None or deadline < self._wake_tick:
+            self._schedule()
+        return future
+
+
+def get_wheel() -> TimerWheel:
+    """Returns the TimerWheel of the running loop, creating it once."""
+    loop = asyncio.get_running_loop()
+    wheel = _wheels.get(loop)
+    if wheel is None:
+        wheel = _wheels[loop] = TimerWheel(loop)
+    return wheel
+
+
+def wheel_sleep(delay: float, result: Any = None) -> Awaitable[Any]:
+    """
+    Drop-in replacement for asyncio.sleep backed by the running
+    loop's TimerWheel. Must be called from a coroutine on that loop.
+    """
+    return get_wheel().sleep(delay, result)
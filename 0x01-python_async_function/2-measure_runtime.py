@@ -3,13 +3,26 @@
 """
 Measure runtime of the wait_n coroutin
 """
-import time
 import asyncio
 import importlib
+from typing import Dict, Optional
 wait_n = importlib.import_module('1-concurrent_coroutines').wait_n
+virtual_clock = importlib.import_module('6-virtual_clock')
+LatencyRecorder = importlib.import_module('8-latency').LatencyRecorder
 
 
-def measure_time(n: int, max_delay: int) -> float:
+async def _timed_wait_n(n: int, max_delay: int) -> float:
+    """
+    Runs wait_n and returns its elapsed time as seen by the running
+    loop's clock, which is simulated time on a virtual clock loop.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    await wait_n(n, max_delay)
+    return loop.time() - start_time
+
+
+def measure_time(n: int, max_delay: int, virtual: bool = False) -> float:
     """
     Measures the total execution time of the wait_n coroutine and returns
     the average time per coroutine execution.
@@ -17,13 +30,55 @@ def measure_time(n: int, max_delay: int) -> float:
     Args:
         n (int): The number of coroutines to run.
         max_delay (int): The maximum delay for each coroutine.
+        virtual (bool, optional): Run on a VirtualClockEventLoop and
+        report simulated time instead of sleeping for real.
 
     Returns:
         float: The average time per coroutine in seconds.
     """
-    start_time = time.time()
-    asyncio.run(wait_n(n, max_delay))
-    end_time = time.time()
-    total_time = end_time - start_time
+    run = virtual_clock.run if virtual else asyncio.run
+    total_time = run(_timed_wait_n(n, max_delay))
     average_time = total_time / n
     return average_time
+
+
+async def _recorded_wait_n(n: int, max_delay: int,
+                           recorder: Optional[LatencyRecorder],
+                           virtual: bool) -> LatencyRecorder:
+    """
+    Runs n instrumented wait_random coroutines concurrently.
+    On a virtual clock loop the recorder, including one passed in,
+    is switched to the loop's clock so it records simulated time.
+    """
+    if recorder is None:
+        recorder = LatencyRecorder()
+    if virtual:
+        loop = asyncio.get_running_loop()
+        recorder.clock = lambda: int(loop.time() * 1e9)
+    await asyncio.gather(*(recorder.wait_random(max_delay)
+                           for _ in range(n)))
+    return recorder
+
+
+def measure_time_stats(n: int, max_delay: int, virtual: bool = False,
+                       recorder: Optional[LatencyRecorder] = None
+                       ) -> Dict[str, float]:
+    """
+    Like measure_time, but also reports the latency distribution of the
+    individual coroutines using high-resolution timers.
+
+    Args:
+        n (int): The number of coroutines to run.
+        max_delay (int): The maximum delay for each coroutine.
+        virtual (bool, optional): Run on a VirtualClockEventLoop.
+        recorder (LatencyRecorder, optional): Recorder to fill, so the
+        caller can also inspect scheduling and lag histograms. With
+        virtual, its clock is replaced by the loop's clock.
+
+    Returns:
+        Dict[str, float]: avg, p50, p95, p99 and max run time
+        per coroutine in seconds.
+    """
+    run = virtual_clock.run if virtual else asyncio.run
+    recorder = run(_recorded_wait_n(n, max_delay, recorder, virtual))
+    return recorder.run.summary()
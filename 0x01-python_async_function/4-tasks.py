@@ -4,11 +4,48 @@ Module to create a coroutine that spawns multiple tasks
 """
 import asyncio
 from importlib import import_module
-from typing import List
+from typing import AsyncIterator, List, Optional
 task_wait_random = import_module('3-tasks').task_wait_random
+WorkerPool = import_module('5-worker_pool').WorkerPool
 
 
-async def task_wait_n(n: int, max_delay: int) -> List[float]:
+async def task_wait_n_iter(n: int, max_delay: int,
+                           max_in_flight: Optional[int] = None,
+                           pool: Optional[WorkerPool] = None
+                           ) -> AsyncIterator[float]:
+    """
+    Function that spawns n tasks with max_delay and yields
+    each delay as soon as its task finishes.
+
+    Args:
+    n (int): The number of tasks to create.
+    max_delay (int): The maximum delay for each task.
+    max_in_flight (int, optional): If set, keep at most this many
+    tasks alive at once through a WorkerPool.
+    pool (WorkerPool, optional): Run through this pool instead, so
+    the caller can read its stats(). Overrides max_in_flight.
+
+    Yields:
+    float: The delay of the next task to finish.
+    """
+    if pool is None and max_in_flight:
+        pool = WorkerPool(max_in_flight)
+    if pool is not None:
+        async for delay in pool.imap(lambda: task_wait_random(max_delay), n):
+            yield delay
+        return
+    tasks = [task_wait_random(max_delay) for _ in range(n)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def task_wait_n(n: int, max_delay: int,
+                      max_in_flight: Optional[int] = None,
+                      pool: Optional[WorkerPool] = None) -> List[float]:
     """
     Function that spawns n tasks with max_delay and gathers their results.
     The delays are returned in ascending order.
@@ -16,17 +53,13 @@ async def task_wait_n(n: int, max_delay: int) -> List[float]:
     Args:
     n (int): The number of tasks to create.
     max_delay (int): The maximum delay for each task.
+    max_in_flight (int, optional): Concurrency limit,
+    see task_wait_n_iter.
+    pool (WorkerPool, optional): Pool to run through,
+    see task_wait_n_iter.
 
     Returns:
     List[float]: A list of delays sorted in ascending order.
     """
-    tasks = [task_wait_random(max_delay) for _ in range(n)]
-    delays = await asyncio.gather(*tasks)
-
-    sorted_delays = []
-    while delays:
-        min_delay = min(delays)
-        sorted_delays.append(min_delay)
-        delays.remove(min_delay)
-
-    return sorted_delays
+    return sorted([delay async for delay in task_wait_n_iter(
+        n, max_delay, max_in_flight, pool)])
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Module providing a bounded-concurrency worker pool
+that keeps at most max_in_flight awaitables alive at once.
+"""
+import asyncio
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Optional,
+                    TypeVar)
+
+T = TypeVar('T')
+
+
+class WorkerPool:
+    """
+    Runs jobs produced by a factory on a fixed number of workers.
+
+    New jobs are only created when a worker is free and results are
+    handed over through a bounded queue, so a slow consumer pauses
+    the workers (backpressure) and memory stays constant in n.
+    A pool runs one imap at a time; its counters describe that run.
+    """
+
+    def __init__(self, max_in_flight: int, buffer: int = 0) -> None:
+        """
+        Args:
+            max_in_flight (int): Maximum number of jobs alive at once.
+            buffer (int, optional): Size of the result queue.
+            Defaults to max_in_flight.
+        """
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self.buffer = buffer or max_in_flight
+        self.submitted = 0
+        self.completed = 0
+        self.pending = 0
+        self._results: "asyncio.Queue" = None
+        self._closing = False
+        self._running = False
+        self._loop: Any = None
+        self._start = 0.0
+        self._end: Optional[float] = None
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently running."""
+        return self.submitted - self.completed
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of finished results waiting to be consumed."""
+        return self._results.qsize() if self._results else 0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Completed jobs per second over the current or last run,
+        measured with the loop's clock (simulated time on a virtual
+        clock loop).
+        """
+        if self._loop is None:
+            return 0.0
+        end = self._end if self._end is not None else self._loop.time()
+        elapsed = end - self._start
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Returns a snapshot of the pool counters."""
+        return {
+            "pending": self.pending,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "throughput": self.throughput,
+        }
+
+    async def _worker(self, job: Callable[[], Awaitable[T]]) -> None:
+        """
+        Pulls jobs until none are pending and queues their results.
+        A failed or cancelled job still queues one result, so imap
+        always receives n of them; only imap closing stops a worker.
+        """
+        while self.pending:
+            self.pending -= 1
+            self.submitted += 1
+            try:
+                result = (None, await job())
+            except asyncio.CancelledError as exc:
+                if self._closing:
+                    raise
+                result = (exc, None)
+            except Exception as exc:
+                result = (exc, None)
+            self.completed += 1
+            await self._results.put(result)
+
+    async def imap(self, job: Callable[[], Awaitable[T]],
+                   n: int) -> AsyncIterator[T]:
+        """
+        Runs job() n times and yields results in completion order.
+
+        Args:
+            job (Callable[[], Awaitable[T]]): Factory for one job.
+            n (int): Number of jobs to run.
+
+        Yields:
+            T: The result of the next job to finish.
+
+        Raises:
+            RuntimeError: If another imap is already running on this pool.
+        """
+        if self._running:
+            raise RuntimeError("WorkerPool.imap is already running; "
+                               "use one pool per concurrent run")
+        self._running = True
+        self.pending = n
+        self._closing = False
+        self.submitted = self.completed = 0
+        self._results = asyncio.Queue(self.buffer)
+        self._loop = asyncio.get_running_loop()
+        self._start = self._loop.time()
+        self._end = None
+        workers = [asyncio.ensure_future(self._worker(job))
+                   for _ in range(min(self.max_in_flight, n))]
+        try:
+            for _ in range(n):
+                error, result = await self._results.get()
+                if error is not None:
+                    raise error
+                yield result
+        finally:
+            self._closing = True
+            for worker in workers:
+                worker.cancel()
+            self._end = self._loop.time()
+            self._running = False
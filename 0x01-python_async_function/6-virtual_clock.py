@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Module providing an event loop with a virtual clock.
+
+Whenever the loop would block waiting for the next timer, the clock
+jumps straight to it instead, so sleep-bound code such as wait_random
+finishes in milliseconds while loop.time() still reports the
+simulated elapsed time.
+"""
+import asyncio
+import selectors
+from typing import Any, Awaitable, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class _WarpSelector:
+    """
+    Selector wrapper that turns a blocking select into a clock jump.
+    """
+
+    def __init__(self, selector: selectors.BaseSelector,
+                 loop: "VirtualClockEventLoop") -> None:
+        self._selector = selector
+        self._loop = loop
+
+    def select(self, timeout: Optional[float] = None) -> List[Tuple]:
+        """
+        Advances the virtual clock by timeout and polls without blocking.
+        A timeout of None (no timers pending) still blocks on real I/O.
+        """
+        if timeout is not None:
+            if timeout > 0:
+                self._loop.advance(timeout)
+            timeout = 0
+        return self._selector.select(timeout)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._selector, name)
+
+
+class VirtualClockEventLoop(asyncio.SelectorEventLoop):
+    """
+    Selector event loop whose time() is a virtual clock
+    that only moves when the loop has nothing else to do.
+    """
+
+    def __init__(self, selector: Optional[selectors.BaseSelector] = None
+                 ) -> None:
+        super().__init__(selector)
+        self._virtual_time = 0.0
+        self._selector = _WarpSelector(self._selector, self)
+
+    def time(self) -> float:
+        """Returns the current virtual time in seconds."""
+        return self._virtual_time
+
+    def advance(self, seconds: float) -> None:
+        """
+        Moves the virtual clock forward.
+
+        Args:
+            seconds (float): How far to move the clock.
+        """
+        self._virtual_time += seconds
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Cancels the tasks still pending on loop and waits for them,
+    reporting any that failed with something other than cancellation.
+    """
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(
+        asyncio.gather(*tasks, return_exceptions=True))
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            loop.call_exception_handler({
+                "message": "unhandled exception during virtual_clock.run()"
+                           " shutdown",
+                "exception": task.exception(),
+                "task": task,
+            })
+
+
+def run(main: Awaitable[T]) -> T:
+    """
+    Same as asyncio.run but on a fresh VirtualClockEventLoop: the loop
+    is set as current while main runs, and on exit leftover tasks are
+    cancelled, async generators and the default executor are shut
+    down, and the loop is closed.
+
+    Args:
+        main (Awaitable[T]): The coroutine to run.
+
+    Returns:
+        T: The result of the coroutine.
+    """
+    loop = VirtualClockEventLoop()
+    try:
+        asyncio.set_event_loop(loop)
+        return loop.run_until_complete(main)
+    finally:
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            # Python 3.9+; older loops have no default executor shutdown.
+            if hasattr(loop, "shutdown_default_executor"):
+                loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Module to spread wait_n across a process pool, one
+event loop per worker, and merge the sorted shards.
+"""
+import asyncio
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from typing import List, Optional
+wait_n = import_module('1-concurrent_coroutines').wait_n
+
+
+def _run_shard(n: int, max_delay: int) -> List[float]:
+    """
+    Runs wait_n on a fresh event loop inside a worker process.
+
+    Args:
+        n (int): Number of coroutines in this shard.
+        max_delay (int): Maximum delay in seconds.
+
+    Returns:
+        List[float]: The shard's delays in ascending order.
+    """
+    return asyncio.run(wait_n(n, max_delay))
+
+
+async def wait_n_parallel(n: int, max_delay: int,
+                          workers: Optional[int] = None) -> List[float]:
+    """
+    Splits n wait_random coroutines across worker processes
+    and returns all the delays in ascending order.
+
+    Args:
+        n (int): Total number of coroutines to run.
+        max_delay (int): Maximum delay in seconds.
+        workers (int, optional): Number of processes.
+        Defaults to os.cpu_count().
+
+    Returns:
+        List[float]: List of delays in ascending order.
+    """
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+    size, extra = divmod(n, workers)
+    shards = [size + (i < extra) for i in range(workers)]
+    loop = asyncio.get_running_loop()
+    pool = ProcessPoolExecutor(workers)
+    futures = [loop.run_in_executor(pool, _run_shard, shard, max_delay)
+               for shard in shards]
+    try:
+        results = await asyncio.gather(*futures)
+    finally:
+        # Cancelling the loop futures also drops shards that have not
+        # started; shutting down without waiting keeps the loop free.
+        for future in futures:
+            future.cancel()
+        pool.shutdown(wait=False)
+    return list(heapq.merge(*results))
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Module providing latency instrumentation for wait_random.
+
+LatencyHistogram is an HDR-style log-linear histogram: values are
+bucketed with a fixed number of significant bits, so memory is bounded
+no matter how many samples are recorded and every percentile is exact
+to within 1 / 2 ** (precision - 1) of the true value.
+"""
+import asyncio
+import time
+from importlib import import_module
+from typing import Any, Callable, Coroutine, Dict
+wait_random = import_module('0-basic_async_syntax').wait_random
+
+
+class LatencyHistogram:
+    """
+    Bounded-memory histogram of non-negative integer latencies (ns).
+    """
+
+    def __init__(self, precision: int = 7) -> None:
+        """
+        Args:
+            precision (int, optional): Significant bits kept per value.
+            Defaults to 7 (under 1.6% relative error).
+        """
+        self.precision = precision
+        self._sub_buckets = 1 << precision
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        """Maps a value to its bucket; indexes grow with the value."""
+        shift = max(value.bit_length() - self.precision, 0)
+        return shift * self._sub_buckets + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        """Returns the largest value that falls in a bucket."""
+        shift, mantissa = divmod(index, self._sub_buckets)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """
+        Adds one sample.
+
+        Args:
+            value (int): The latency in nanoseconds.
+        """
+        value = max(int(value), 0)
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of the recorded samples."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the value at the given percentile.
+
+        Args:
+            percent (float): Percentile between 0 and 100.
+
+        Returns:
+            int: Upper bound of the bucket holding that percentile,
+            capped at the exact maximum.
+        """
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._highest_equivalent(index), self.max)
+        return self.max
+
+    def summary(self, scale: float = 1e-9) -> Dict[str, float]:
+        """
+        Returns avg/p50/p95/p99/max, multiplied by scale.
+
+        Args:
+            scale (float, optional): Unit conversion, seconds by default.
+        """
+        return {
+            "avg": self.mean * scale,
+            "p50": self.percentile(50) * scale,
+            "p95": self.percentile(95) * scale,
+            "p99": self.percentile(99) * scale,
+            "max": self.max * scale,
+        }
+
+
+class LatencyRecorder:
+    """
+    Wraps wait_random and records, for every call:
+    - scheduling: time from creation until the coroutine first runs,
+    - run: time from first run until it returns,
+    - lag: how much later than its requested delay it returned.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns
+                 ) -> None:
+        """
+        Args:
+            clock (Callable[[], int], optional): Nanosecond clock.
+            Defaults to time.perf_counter_ns.
+        """
+        self.clock = clock
+        self.scheduling = LatencyHistogram()
+        self.run = LatencyHistogram()
+        self.lag = LatencyHistogram()
+
+    async def _timed(self, created: int, max_delay: int) -> float:
+        """Runs wait_random and records its timings."""
+        started = self.clock()
+        delay = await wait_random(max_delay)
+        finished = self.clock()
+        self.scheduling.record(started - created)
+        self.run.record(finished - started)
+        self.lag.record(finished - started - int(delay * 1e9))
+        return delay
+
+    def wait_random(self, max_delay: int = 10
+                    ) -> Coroutine[Any, Any, float]:
+        """
+        Instrumented drop-in for wait_random.
+        The creation time is taken here, when the coroutine is made.
+        """
+        return self._timed(self.clock(), max_delay)
+
+    def task_wait_random(self, max_delay: int) -> asyncio.Task:
+        """Instrumented drop-in for task_wait_random."""
+        return asyncio.create_task(self.wait_random(max_delay))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Module providing a batched version of wait_n.
+
+All delays are drawn in one vectorized call (NumPy when installed,
+the random module otherwise) and sorted once. Delays falling in the
+same timer slot of `resolution` seconds share a single wakeup, so
+the loop handles one timer per slot instead of one per coroutine.
+"""
+import asyncio
+import random
+from bisect import bisect_left
+from typing import AsyncIterator, List
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def draw_sorted_delays(n: int, max_delay: float) -> List[float]:
+    """
+    Draws n delays uniformly from [0, max_delay] in one batch.
+    The NumPy generator is seeded from random, so random.seed makes
+    the result reproducible either way.
+
+    Args:
+        n (int): Number of delays.
+        max_delay (float): Maximum delay in seconds.
+
+    Returns:
+        List[float]: The delays in ascending order.
+    """
+    if numpy is not None:
+        generator = numpy.random.default_rng(random.getrandbits(64))
+        delays = generator.random(n) * max_delay
+        delays.sort()
+        return delays.tolist()
+    uniform = random.random
+    return sorted([uniform() * max_delay for _ in range(n)])
+
+
+async def wait_n_batched_iter(n: int, max_delay: int,
+                              resolution: float = 0.001
+                              ) -> AsyncIterator[float]:
+    """
+    Yields n random delays in ascending order, each one no earlier
+    than that many seconds after the call, waking up once per slot.
+
+    Args:
+        n (int): Number of delays.
+        max_delay (int): Maximum delay in seconds.
+        resolution (float, optional): Width of a timer slot in seconds.
+        Defaults to 1 ms.
+
+    Yields:
+        float: The next delay.
+    """
+    delays = draw_sorted_delays(n, max_delay)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    first = 0
+    while first < n:
+        slot_end = (delays[first] // resolution + 1) * resolution
+        last = max(bisect_left(delays, slot_end, first), first + 1)
+        await asyncio.sleep(start + delays[last - 1] - loop.time())
+        for index in range(first, last):
+            yield delays[index]
+        first = last
+
+
+async def wait_n_batched(n: int, max_delay: int,
+                         resolution: float = 0.001) -> List[float]:
+    """
+    Batched equivalent of wait_n: returns n delays in ascending order
+    once the longest of them has elapsed.
+
+    Args:
+        n (int): Number of delays.
+        max_delay (int): Maximum delay in seconds.
+        resolution (float, optional): Width of a timer slot in seconds.
+
+    Returns:
+        List[float]: List of delays in ascending order.
+    """
+    return [delay async for delay in
+            wait_n_batched_iter(n, max_delay, resolution)]
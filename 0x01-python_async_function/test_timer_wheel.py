@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the TimerWheel from the 10-timer_wheel module.
+
+Every test runs on a VirtualClockEventLoop, so even sleeps of hours
+finish instantly and wakeup times can be checked exactly.
+"""
+
+import asyncio
+import random
+import unittest
+from importlib import import_module
+from typing import Any, Coroutine, List, Tuple
+
+timer_wheel = import_module('10-timer_wheel')
+virtual_clock = import_module('6-virtual_clock')
+
+RESOLUTION = 0.001
+# Float slack when comparing virtual times.
+EPSILON = 1e-6
+# Virtual seconds after which a test fails instead of hanging
+# on a sleeper that never wakes.
+TIMEOUT = 1000.0
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Runs main on a fresh virtual clock loop."""
+    return virtual_clock.run(asyncio.wait_for(main, TIMEOUT))
+
+
+async def timed_sleep(delay: float) -> Tuple[float, float]:
+    """Sleeps on the wheel and returns (delay, actual elapsed time)."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await timer_wheel.wheel_sleep(delay)
+    return delay, loop.time() - start
+
+
+class TestTimerWheel(unittest.TestCase):
+    """
+    Test case for TimerWheel and wheel_sleep.
+
+    These tests cover:
+    - wakeups that are never early and at most one tick late,
+    - delays cascading from one and two levels above level 0,
+    - cancelled sleepers, and sleeps added while the wheel is idle
+    or lagging behind a pending long timer.
+    """
+
+    def assertOnTime(self, results: List[Tuple[float, float]]) -> None:
+        """Checks that each sleep lasted between delay and delay + 1 tick."""
+        for delay, elapsed in results:
+            self.assertGreaterEqual(elapsed, delay - EPSILON)
+            self.assertLessEqual(elapsed, delay + RESOLUTION + EPSILON)
+
+    def test_random_delays_never_early(self):
+        """
+        Test that many random delays spread over all levels wake
+        up no earlier than requested and at most one tick late.
+        """
+        rng = random.Random(0)
+        delays = [rng.uniform(0, 200) for _ in range(2000)]
+
+        async def main():
+            return await asyncio.gather(*(timed_sleep(d) for d in delays))
+
+        self.assertOnTime(run(main()))
+
+    def test_cascade_one_level(self):
+        """
+        Test delays past level 0 (over 256 ticks) that have to be
+        cascaded down from level 1.
+        """
+        delays = [0.257, 0.3, 1.0, 12.345, 65.535]
+
+        async def main():
+            return await asyncio.gather(*(timed_sleep(d) for d in delays))
+
+        self.assertOnTime(run(main()))
+
+    def test_cascade_two_levels(self):
+        """
+        Test delays past level 1 (over 65,536 ticks) that have to be
+        cascaded down from level 2 and then level 1.
+        """
+        delays = [65.537, 70.0, 131.072, 300.0]
+
+        async def main():
+            return await asyncio.gather(*(timed_sleep(d) for d in delays))
+
+        self.assertOnTime(run(main()))
+
+    def test_result(self):
+        """Test that the sleep resolves to the given result."""
+        async def main():
+            return await timer_wheel.wheel_sleep(0.5, "done")
+
+        self.assertEqual(run(main()), "done")
+
+    def test_cancelled_sleeper(self):
+        """
+        Test that cancelling a sleeper neither wakes it nor disturbs
+        the other timers, and that the wheel ends up empty.
+        """
+        async def main():
+            cancelled = asyncio.ensure_future(timed_sleep(5.0))
+            other = asyncio.ensure_future(timed_sleep(10.0))
+            await asyncio.sleep(1.0)
+            cancelled.cancel()
+            result = await other
+            self.assertTrue(cancelled.cancelled())
+            self.assertEqual(len(timer_wheel.get_wheel()), 0)
+            return [result]
+
+        self.assertOnTime(run(main()))
+
+    def test_sleep_after_idle(self):
+        """
+        Test that a sleep started after the wheel sat idle for a long
+        time is measured from the current time, not a stale tick.
+        """
+        async def main():
+            results = [await timed_sleep(0.5)]
+            await asyncio.sleep(100.0)
+            results.append(await timed_sleep(0.5))
+            results.append(await timed_sleep(300.0))
+            return results
+
+        self.assertOnTime(run(main()))
+
+    def test_short_sleep_while_lagging(self):
+        """
+        Test that a short sleep added while only a long timer is
+        pending reschedules the wheel and still wakes on time.
+        """
+        async def main():
+            long_sleep = asyncio.ensure_future(timed_sleep(100.0))
+            await asyncio.sleep(50.0)
+            results = await asyncio.gather(timed_sleep(0.2),
+                                           timed_sleep(0.0015))
+            return list(results) + [await long_sleep]
+
+        self.assertOnTime(run(main()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the WorkerPool from the 5-worker_pool module.
+
+Every test runs on a VirtualClockEventLoop, so sleeps finish
+instantly and throughput is reported in simulated time.
+"""
+
+import asyncio
+import unittest
+from importlib import import_module
+from typing import Any, Coroutine
+
+WorkerPool = import_module('5-worker_pool').WorkerPool
+wait_n = import_module('1-concurrent_coroutines').wait_n
+virtual_clock = import_module('6-virtual_clock')
+
+# Virtual seconds after which a test fails instead of hanging.
+TIMEOUT = 1000.0
+
+
+def run(main: Coroutine[Any, Any, Any]) -> Any:
+    """Runs main on a fresh virtual clock loop."""
+    return virtual_clock.run(asyncio.wait_for(main, TIMEOUT))
+
+
+class TestWorkerPool(unittest.TestCase):
+    """
+    Test case for WorkerPool.
+
+    These tests cover:
+    - the concurrency limit and the results of a run,
+    - cancelled jobs, which still count as one result,
+    - sharing one pool between concurrent runs, which is refused,
+    - throughput measured with the loop's clock.
+    """
+
+    def test_max_in_flight(self):
+        """Test that no more than max_in_flight jobs run at once."""
+        running = [0]
+        peak = [0]
+
+        async def job():
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(1)
+            running[0] -= 1
+            return 1
+
+        async def main():
+            pool = WorkerPool(3)
+            return [result async for result in pool.imap(job, 10)]
+
+        self.assertEqual(run(main()), [1] * 10)
+        self.assertEqual(peak[0], 3)
+
+    def test_cancelled_job(self):
+        """
+        Test that a cancelled job reaches the consumer as an error
+        instead of leaving imap waiting forever.
+        """
+        async def job():
+            task = asyncio.ensure_future(asyncio.sleep(10))
+            asyncio.get_running_loop().call_later(1, task.cancel)
+            return await task
+
+        async def main():
+            pool = WorkerPool(2)
+            with self.assertRaises(asyncio.CancelledError):
+                async for _ in pool.imap(job, 3):
+                    pass
+
+        run(main())
+
+    def test_concurrent_runs_refused(self):
+        """
+        Test that running two wait_n calls on one pool at the same time
+        raises RuntimeError instead of deadlocking.
+        """
+        async def main():
+            pool = WorkerPool(4)
+            with self.assertRaises(RuntimeError):
+                await asyncio.gather(wait_n(10, 5, pool=pool),
+                                     wait_n(10, 5, pool=pool))
+
+        run(main())
+
+    def test_sequential_runs_reuse_pool(self):
+        """Test that a pool can be reused once the previous run ended."""
+        async def main():
+            pool = WorkerPool(4)
+            first = await wait_n(10, 5, pool=pool)
+            second = await wait_n(10, 5, pool=pool)
+            return first, second, pool.stats()
+
+        first, second, stats = run(main())
+        self.assertEqual((len(first), len(second)), (10, 10))
+        self.assertEqual(stats["completed"], 10)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_throughput_uses_loop_clock(self):
+        """
+        Test that throughput is jobs per simulated second on a
+        virtual clock loop.
+        """
+        async def main():
+            pool = WorkerPool(2)
+            async for _ in pool.imap(lambda: asyncio.sleep(1), 10):
+                pass
+            return pool.throughput
+
+        self.assertAlmostEqual(run(main()), 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,7 +4,8 @@ This module defines an asynchronous generator coroutine.
 """
 import asyncio
 import random
-from typing import Generator
+from array import array
+from typing import AsyncIterator, Generator
 
 
 async def async_generator() -> Generator[float, None, None]:
@@ -20,3 +21,61 @@ async def async_generator() -> Generator[float, None, None]:
     for _ in range(10):
         await asyncio.sleep(1)
         yield random.uniform(0, 10)
+
+
+async def _produce_chunks(queue: asyncio.Queue, total: int,
+                          chunk_size: int, delay: float) -> None:
+    """
+    Producer task: fills the read-ahead queue with (True, chunk) items,
+    sleeping once per chunk for delay seconds per value in it.
+    Ends with an end-of-stream marker (False, error), where error is
+    None, or the exception that stopped production.
+    """
+    uniform = random.uniform
+    try:
+        for start in range(0, total, chunk_size):
+            size = min(chunk_size, total - start)
+            await asyncio.sleep(delay * size)
+            await queue.put(
+                (True, array('d', [uniform(0, 10) for _ in range(size)])))
+    except Exception as exc:
+        await queue.put((False, exc))
+    else:
+        await queue.put((False, None))
+
+
+async def async_generator_chunks(total: int = 10, chunk_size: int = 10,
+                                 delay: float = 1,
+                                 prefetch: int = 2) -> AsyncIterator[array]:
+    """
+    Batched counterpart of async_generator: yields the same kind of
+    random numbers as array('d') chunks of up to chunk_size values.
+    A producer task keeps up to prefetch chunks ready ahead of the
+    consumer, so consuming one chunk overlaps producing the next.
+    Args:
+        total (int): Number of values to generate. Defaults to 10.
+        chunk_size (int): Values per chunk. Defaults to 10.
+        delay (float): Production time per value in seconds.
+        Defaults to 1, like async_generator.
+        prefetch (int): Number of chunks buffered ahead. Defaults to 2.
+    Yields:
+        array: A chunk of floating-point numbers between 0 and 10.
+    Raises:
+        ValueError: If chunk_size or prefetch is less than 1.
+    """
+    if chunk_size < 1 or prefetch < 1:
+        raise ValueError("chunk_size and prefetch must be at least 1")
+    queue: asyncio.Queue = asyncio.Queue(prefetch)
+    producer = asyncio.ensure_future(
+        _produce_chunks(queue, total, chunk_size, delay))
+    try:
+        while True:
+            is_chunk, value = await queue.get()
+            if not is_chunk:
+                break
+            yield value
+        if value is not None:
+            raise value
+        await producer
+    finally:
+        producer.cancel()
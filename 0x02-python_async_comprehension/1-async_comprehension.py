@@ -3,16 +3,28 @@
 This module defines an asynchronous comprehension coroutine.
 """
 import asyncio
-from typing import List
-async_generator = __import__('0-async_generator').async_generator
+from typing import List, Optional
+async_generator_module = __import__('0-async_generator')
+async_generator = async_generator_module.async_generator
+async_generator_chunks = async_generator_module.async_generator_chunks
 
 
-async def async_comprehension() -> List[float]:
+async def async_comprehension(chunk_size: Optional[int] = None
+                              ) -> List[float]:
     """
     Coroutine that collects 10 random numbers
     using an async comprehension
     over async_generator.
+    Args:
+        chunk_size (int, optional): If set, collect whole chunks from
+        async_generator_chunks instead, which costs one await per
+        chunk rather than one per number.
     Returns:
         List[float]: A list of 10 random floating-point numbers.
     """
+    if chunk_size:
+        numbers: List[float] = []
+        async for chunk in async_generator_chunks(chunk_size=chunk_size):
+            numbers.extend(chunk)
+        return numbers
     return [number async for number in async_generator()]
@@ -4,9 +4,10 @@ This module measures the runtime of
 running async_comprehension in parallel.
 """
 import asyncio
-import time
-from typing import List
+from typing import Dict, List
 async_comprehension = __import__('1-async_comprehension').async_comprehension
+async_generator = __import__('0-async_generator').async_generator
+amerge = __import__('3-amerge').amerge
 
 
 async def measure_runtime() -> float:
@@ -14,10 +15,39 @@ async def measure_runtime() -> float:
     Coroutine that measures the total runtime
     of running async_comprehension
     four times in parallel using asyncio.gather.
+    Time is read from the running loop's clock, so on a
+    virtual clock loop the result is the simulated runtime.
     Returns:
         float: The total runtime in seconds.
     """
-    start_time = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
     await asyncio.gather(*(async_comprehension() for _ in range(4)))
-    total_runtime = time.perf_counter() - start_time
+    total_runtime = loop.time() - start_time
     return total_runtime
+
+
+async def measure_stream(streams: int = 4) -> Dict[str, float]:
+    """
+    Coroutine that merges several async_generator streams with amerge
+    and measures how soon and how fast items become available.
+    Args:
+        streams (int): Number of async_generator streams. Defaults to 4.
+    Returns:
+        Dict[str, float]: total runtime, time to first item and
+        sustained items per second, in seconds of the loop's clock.
+    """
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    first_item = None
+    items = 0
+    async for _ in amerge(*(async_generator() for _ in range(streams))):
+        if first_item is None:
+            first_item = loop.time() - start_time
+        items += 1
+    total_runtime = loop.time() - start_time
+    return {
+        "total": total_runtime,
+        "first_item": first_item or 0.0,
+        "items_per_sec": items / total_runtime if total_runtime else 0.0,
+    }
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+This module defines a fan-in merge of many async generators.
+"""
+import asyncio
+import heapq
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+
+async def _pump(source: AsyncIterator[Any], queue: asyncio.Queue) -> None:
+    """
+    Copies one source into the shared queue, then puts an
+    end-of-source marker carrying the error, if any.
+    """
+    try:
+        async for item in source:
+            await queue.put((True, item))
+    except Exception as exc:
+        await queue.put((False, exc))
+    else:
+        await queue.put((False, None))
+
+
+async def _merge_ordered(sources: List[AsyncIterator[Any]],
+                         key: Callable[[Any], Any]) -> AsyncIterator[Any]:
+    """
+    K-way merge of sources that are each sorted by key: holds one
+    item per source and always yields the smallest.
+    """
+    async def head(index: int) -> None:
+        try:
+            item = await sources[index].__anext__()
+        except StopAsyncIteration:
+            return
+        heapq.heappush(heap, (key(item), index, item))
+
+    heap: List[Any] = []
+    await asyncio.gather(*(head(index) for index in range(len(sources))))
+    while heap:
+        _, index, item = heapq.heappop(heap)
+        yield item
+        await head(index)
+
+
+async def amerge(*sources: AsyncIterator[Any], buffer: int = 16,
+                 key: Optional[Callable[[Any], Any]] = None
+                 ) -> AsyncIterator[Any]:
+    """
+    Coroutine that consumes many async generators concurrently
+    and yields their items as they arrive.
+    Items go through a queue of at most buffer entries, so sources
+    pause when the consumer falls behind (backpressure).
+    Args:
+        *sources: The async generators to merge.
+        buffer (int): Maximum number of buffered items. Defaults to 16.
+        key (Callable, optional): If set, assume every source is sorted
+        by key (e.g. a timestamp) and yield items in key order instead.
+        This mode ignores buffer and holds exactly one item per source.
+    Yields:
+        Any: The next item from any source.
+    Raises:
+        ValueError: If buffer is less than 1.
+    """
+    if buffer < 1:
+        raise ValueError("buffer must be at least 1")
+    if key is not None:
+        async for item in _merge_ordered(list(sources), key):
+            yield item
+        return
+    queue: asyncio.Queue = asyncio.Queue(buffer)
+    pumps = [asyncio.ensure_future(_pump(source, queue))
+             for source in sources]
+    try:
+        remaining = len(pumps)
+        while remaining:
+            is_item, value = await queue.get()
+            if is_item:
+                yield value
+                continue
+            if value is not None:
+                raise value
+            remaining -= 1
+    finally:
+        for pump in pumps:
+            pump.cancel()
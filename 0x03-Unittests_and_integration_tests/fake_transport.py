@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+In-process fake HTTP transport for the test suite.
+
+Stands in for requests.get and serves prebuilt responses from a URL
+map, so tests avoid building Mock objects on every call.
+"""
+from typing import Any, Dict, List
+
+
+class FakeResponse:
+    """Minimal response object exposing json()."""
+
+    __slots__ = ("_payload",)
+
+    def __init__(self, payload: Any) -> None:
+        self._payload = payload
+
+    def json(self) -> Any:
+        """Returns the payload this response was built with."""
+        return self._payload
+
+
+class FakeTransport:
+    """
+    Callable replacement for requests.get that serves payloads
+    from a URL map and records the requested URLs.
+    """
+
+    def __init__(self, routes: Dict[str, Any]) -> None:
+        """
+        Args:
+            routes (Dict[str, Any]): JSON payload to serve for each URL.
+        """
+        self._responses = {url: FakeResponse(payload)
+                           for url, payload in routes.items()}
+        self.calls: List[str] = []
+
+    def __call__(self, url: str) -> FakeResponse:
+        """Returns the prebuilt response for url, KeyError if unknown."""
+        self.calls.append(url)
+        return self._responses[url]
@@ -4,9 +4,10 @@ Unit and integration tests for the GithubOrgClient class.
 """
 
 import unittest
-from unittest.mock import patch, PropertyMock, Mock
+from unittest.mock import patch, PropertyMock
 from parameterized import parameterized, parameterized_class
 from client import GithubOrgClient
+from fake_transport import FakeTransport
 from fixtures import org_payload, repos_payload, expected_repos, apache2_repos
 
 
@@ -24,28 +25,52 @@ class TestGithubOrgClient(unittest.TestCase):
     the presence of a specified license.
     """
 
+    repos_url = "https://api.github.com/orgs/test_org/repos"
+    repos = [{"name": "repo1"}, {"name": "repo2"}, {"name": "repo3"}]
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Patch `requests.get` with one FakeTransport shared by the class,
+        serving every URL these tests request.
+        """
+        cls.transport = FakeTransport({
+            "https://api.github.com/orgs/google": {"login": "google"},
+            "https://api.github.com/orgs/abc": {"login": "abc"},
+            "https://api.github.com/orgs/test_org": {
+                "login": "test_org", "repos_url": cls.repos_url},
+            cls.repos_url: cls.repos,
+        })
+        cls.get_patcher = patch('requests.get', new=cls.transport)
+        cls.get_patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the patcher for `requests.get`."""
+        cls.get_patcher.stop()
+
+    def setUp(self):
+        """Forget the URLs requested by the previous test."""
+        self.transport.calls.clear()
+
     @parameterized.expand([
         ("google",),
         ("abc",)
     ])
-    @patch('client.get_json')
-    def test_org(self, org_name, mock_get_json):
+    def test_org(self, org_name):
         """
         Test that the org method returns the correct organization data.
 
-        Verifies that the `org` property of GithubOrgClient calls `get_json`
-        with the correct URL and returns the expected organization data.
+        Verifies that the `org` property of GithubOrgClient requests
+        the correct URL once and returns the organization data.
         """
-        expected_json = {"login": org_name}
-        mock_get_json.return_value = expected_json
+        org_url = f"https://api.github.com/orgs/{org_name}"
 
         client = GithubOrgClient(org_name)
         org_data = client.org
 
-        mock_get_json.assert_called_once_with(
-            f"https://api.github.com/orgs/{org_name}"
-        )
-        self.assertEqual(org_data, expected_json)
+        self.assertEqual(self.transport.calls, [org_url])
+        self.assertEqual(org_data, {"login": org_name})
 
     @patch('client.GithubOrgClient.org', new_callable=PropertyMock)
     def test_public_repos_url(self, mock_org):
@@ -66,37 +91,22 @@ class TestGithubOrgClient(unittest.TestCase):
 
         self.assertEqual(public_repos_url, test_payload["repos_url"])
 
-    @patch('client.get_json')
-    @patch(
-        'client.GithubOrgClient._public_repos_url',
-        new_callable=PropertyMock)
-    def test_public_repos(self, mock_public_repos_url, mock_get_json):
+    def test_public_repos(self):
         """
         Test that the public_repos method returns the
         correct list of repositories.
 
         Verifies that the `public_repos` method retrieves
         the list of repositories
-        from the URL provided by `_public_repos_url`
-        and matches the expected list.
+        from the URL provided by `_public_repos_url`,
+        requesting each URL once, and matches the expected list.
         """
-        test_url = "https://api.github.com/orgs/test_org/repos"
-        test_payload = [
-            {"name": "repo1"},
-            {"name": "repo2"},
-            {"name": "repo3"}
-        ]
-        expected_repos = ["repo1", "repo2", "repo3"]
-
-        mock_public_repos_url.return_value = test_url
-        mock_get_json.return_value = test_payload
-
         client = GithubOrgClient("test_org")
         repos = client.public_repos()
 
-        self.assertEqual(repos, expected_repos)
-        mock_public_repos_url.assert_called_once()
-        mock_get_json.assert_called_once_with(test_url)
+        self.assertEqual(repos, ["repo1", "repo2", "repo3"])
+        self.assertEqual(self.transport.calls, [
+            "https://api.github.com/orgs/test_org", self.repos_url])
 
     @parameterized.expand([
         ({"license": {"key": "my_license"}}, "my_license", True),
@@ -137,14 +147,16 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """
-        Set up the class by patching `requests.get` with a mocked function
-        that returns specific payloads.
+        Set up the class by patching `requests.get` with a FakeTransport
+        serving the fixture payloads from a prebuilt URL map.
 
         This setup allows testing without making actual HTTP requests.
         """
-        cls.get_patcher = patch(
-            'requests.get', side_effect=cls.mocked_requests_get
-        )
+        cls.transport = FakeTransport({
+            "https://api.github.com/orgs/google": cls.org_payload,
+            cls.org_payload["repos_url"]: cls.repos_payload,
+        })
+        cls.get_patcher = patch('requests.get', new=cls.transport)
         cls.get_patcher.start()
 
     @classmethod
@@ -155,26 +167,6 @@ class TestIntegrationGithubOrgClient(unittest.TestCase):
         """
         cls.get_patcher.stop()
 
-    @staticmethod
-    def mocked_requests_get(url):
-        """
-        Mocked requests.get function to return specific
-        payloads based on the URL.
-
-        Provides mocked responses for different URLs to
-        simulate API responses during testing.
-        """
-        mock_response = Mock()
-        if 'orgs' in url:
-            mock_response.json.return_value = (
-                    TestIntegrationGithubOrgClient.org_payload
-            )
-        elif 'repos' in url:
-            mock_response.json.return_value = (
-                    TestIntegrationGithubOrgClient.repos_payload
-            )
-        return mock_response
-
     def test_public_repos(self):
         """
         Test the public_repos method to ensure it returns
@@ -4,9 +4,10 @@ Unit tests for the access_nested_map function from the utils module.
 """
 
 import unittest
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 from parameterized import parameterized
 from utils import access_nested_map, get_json, memoize
+from fake_transport import FakeTransport
 
 
 class TestAccessNestedMap(unittest.TestCase):
@@ -65,15 +66,12 @@ class TestGetJson(unittest.TestCase):
     ])
     def test_get_json(self, test_url, test_payload):
         """checks if it returns the expected result"""
-        with patch('utils.requests.get') as mock_get:
-            mock_response = Mock()
-            mock_response.json.return_value = test_payload
-            mock_get.return_value = mock_response
-
+        transport = FakeTransport({test_url: test_payload})
+        with patch('utils.requests.get', new=transport):
             result = get_json(test_url)
 
-            mock_get.assert_called_once_with(test_url)
-            self.assertEqual(result, test_payload)
+        self.assertEqual(transport.calls, [test_url])
+        self.assertEqual(result, test_payload)
 
 
 class TestMemoize(unittest.TestCase):
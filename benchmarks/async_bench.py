@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark harness for the async modules in 0x01 and 0x02.
+
+    ./benchmarks/async_bench.py run -o baseline.json
+    ./benchmarks/async_bench.py compare baseline.json
+    ./benchmarks/async_bench.py compare baseline.json current.csv
+
+`run` sweeps n, max_delay and concurrency mode for wait_n/task_wait_n
+and also times async_comprehension/measure_runtime. Each sample loops
+the case until it takes at least --min-time seconds (like
+timeit.Timer.autorange) and every run reseeds `random`; warmup samples
+are discarded. The results are written as JSON or CSV, depending on
+the output extension.
+
+`compare` reruns the suite with the baseline's parameters (or loads a
+second results file) and exits with status 1 when the fastest run of a
+case got slower by more than both --threshold and the spread of the
+baseline's samples.
+"""
+import argparse
+import asyncio
+import csv
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from importlib import import_module
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+ASYNC_FUNCTION = os.path.join(ROOT, '0x01-python_async_function')
+ASYNC_COMPREHENSION = os.path.join(ROOT, '0x02-python_async_comprehension')
+sys.path[:0] = [ASYNC_FUNCTION, ASYNC_COMPREHENSION]
+
+wait_n = import_module('1-concurrent_coroutines').wait_n
+task_wait_n = import_module('4-tasks').task_wait_n
+virtual_clock = import_module('6-virtual_clock')
+async_comprehension = import_module(
+    '1-async_comprehension').async_comprehension
+
+
+def _load(directory: str, name: str) -> Any:
+    """Loads a module by path, for names that clash across directories."""
+    spec = importlib.util.spec_from_file_location(
+        f"{os.path.basename(directory)}.{name}",
+        os.path.join(directory, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+measure_runtime = _load(
+    ASYNC_COMPREHENSION, '2-measure_runtime').measure_runtime
+
+FIELDS = ["name", "n", "max_delay", "mode", "clock",
+          "number", "median", "min", "max", "stdev", "spread",
+          "throughput"]
+
+
+def _cases(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Expands the sweep into one dict per benchmark case."""
+    cases = []
+    for name in ("wait_n", "task_wait_n"):
+        for n in args.n:
+            for max_delay in args.max_delay:
+                for mode in args.modes:
+                    if mode == "batched" and name != "wait_n":
+                        continue
+                    cases.append({"name": name, "n": n,
+                                  "max_delay": max_delay, "mode": mode})
+    cases.append({"name": "async_comprehension", "n": 10,
+                  "max_delay": 1, "mode": "unbounded"})
+    cases.append({"name": "measure_runtime", "n": 40,
+                  "max_delay": 1, "mode": "unbounded"})
+    for case in cases:
+        case["clock"] = args.clock
+    return cases
+
+
+def _factory(case: Dict[str, Any]) -> Callable[[], Any]:
+    """Returns a callable creating the coroutine for one run of a case."""
+    name = case["name"]
+    if name == "async_comprehension":
+        return async_comprehension
+    if name == "measure_runtime":
+        return measure_runtime
+    mode = case["mode"]
+    if mode == "batched":
+        return lambda: wait_n(case["n"], case["max_delay"], batched=True)
+    max_in_flight = None if mode == "unbounded" else int(mode.split(":")[1])
+    func = wait_n if name == "wait_n" else task_wait_n
+    return lambda: func(case["n"], case["max_delay"], max_in_flight)
+
+
+def _sample(run: Callable[[], None], number: int) -> float:
+    """Returns the mean time of number consecutive calls of run."""
+    start = time.perf_counter()
+    for _ in range(number):
+        run()
+    return (time.perf_counter() - start) / number
+
+
+def _autorange(run: Callable[[], None], min_time: float) -> int:
+    """
+    Returns how many calls of run make a sample of at least min_time
+    seconds, trying 1, 2, 5, 10, 20, 50, ... like timeit does.
+    """
+    i = 1
+    while True:
+        for number in (i, 2 * i, 5 * i):
+            if _sample(run, number) * number >= min_time:
+                return number
+        i *= 10
+
+
+def _measure(case: Dict[str, Any], seed: int, repeat: int,
+             warmup: int, min_time: float) -> Dict[str, Any]:
+    """
+    Times repeat samples of one case, each looping the case until it
+    takes at least min_time seconds, and summarizes the per-run times.
+    """
+    make = _factory(case)
+    loop_run = (virtual_clock.run if case["clock"] == "virtual"
+                else asyncio.run)
+
+    def run() -> None:
+        random.seed(seed)
+        loop_run(make())
+
+    number = _autorange(run, min_time)
+    for _ in range(warmup):
+        _sample(run, number)
+    timings = [_sample(run, number) for _ in range(repeat)]
+    fastest = min(timings)
+    return dict(case, number=number,
+                median=statistics.median(timings),
+                min=fastest, max=max(timings),
+                stdev=statistics.pstdev(timings),
+                spread=max(timings) / fastest - 1 if fastest else 0.0,
+                throughput=case["n"] / fastest if fastest else 0.0)
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    """Runs every case and returns the results with their parameters."""
+    results = []
+    for case in _cases(args):
+        result = _measure(case, args.seed, args.repeat, args.warmup,
+                          args.min_time)
+        print(f"{result['name']:>20} n={result['n']:<8} "
+              f"delay={result['max_delay']:<4} {result['mode']:<12} "
+              f"{result['min'] * 1e3:10.3f} ms "
+              f"{result['throughput']:12.0f} /s", file=sys.stderr)
+        results.append(result)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "n": args.n, "max_delay": args.max_delay, "modes": args.modes,
+            "clock": args.clock, "seed": args.seed,
+            "repeat": args.repeat, "warmup": args.warmup,
+            "min_time": args.min_time,
+        },
+        "results": results,
+    }
+
+
+def save(report: Dict[str, Any], path: str) -> None:
+    """Writes a report as CSV when path ends in .csv, JSON otherwise."""
+    with open(path, "w", newline="") as f:
+        if path.endswith(".csv"):
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(report["results"])
+        else:
+            json.dump(report, f, indent=2)
+
+
+def load(path: str) -> Dict[str, Any]:
+    """Reads a report written by save."""
+    with open(path, newline="") as f:
+        if not path.endswith(".csv"):
+            return json.load(f)
+        results = []
+        for row in csv.DictReader(f):
+            row["n"] = int(row["n"])
+            row["number"] = int(row["number"])
+            for field in ("max_delay", "median", "min", "max", "stdev",
+                          "spread", "throughput"):
+                row[field] = float(row[field])
+            results.append(row)
+        return {"meta": {}, "results": results}
+
+
+def _key(result: Dict[str, Any]) -> tuple:
+    """Identifies a case independently of its measurements."""
+    return (result["name"], float(result["n"]), float(result["max_delay"]),
+            result["mode"], result["clock"])
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            threshold: float) -> List[str]:
+    """
+    Returns a line for every case whose fastest run got slower by more
+    than both threshold (a fraction) and the baseline's own spread.
+    """
+    previous = {_key(result): result for result in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(_key(result))
+        if old is None or not old["min"]:
+            continue
+        slower = result["min"] / old["min"] - 1
+        if slower > max(threshold, old.get("spread", 0.0)):
+            regressions.append(
+                f"{result['name']} n={result['n']} "
+                f"delay={result['max_delay']} {result['mode']} "
+                f"{result['clock']}: min {old['min'] * 1e3:.3f} -> "
+                f"{result['min'] * 1e3:.3f} ms ({slower:+.1%}, "
+                f"baseline spread {old.get('spread', 0.0):.1%})")
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("-o", "--output", default="async_bench.json")
+    run.add_argument("--n", type=int, nargs="+", default=[100, 1000, 10000])
+    run.add_argument("--max-delay", type=float, nargs="+", default=[0, 10])
+    run.add_argument("--modes", nargs="+",
+                     default=["unbounded", "bounded:64", "batched"],
+                     help="unbounded, bounded:<max_in_flight> or batched")
+    run.add_argument("--clock", choices=["virtual", "real"],
+                     default="virtual")
+    cmp = commands.add_parser("compare", help="compare against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current", nargs="?")
+    cmp.add_argument("--threshold", type=float, default=0.10)
+    for sub in (run, cmp):
+        sub.add_argument("--seed", type=int, default=0)
+        sub.add_argument("--repeat", type=int, default=5)
+        sub.add_argument("--warmup", type=int, default=1)
+        sub.add_argument("--min-time", type=float, default=0.2,
+                         help="minimum seconds per sample")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        save(run_suite(args), args.output)
+        return 0
+
+    baseline = load(args.baseline)
+    if args.current:
+        current = load(args.current)
+    elif not baseline["meta"]:
+        parser.error("a CSV baseline needs a current results file")
+    else:
+        for field, value in baseline["meta"].items():
+            if field in ("n", "max_delay", "modes", "clock", "seed",
+                         "min_time"):
+                setattr(args, field, value)
+        current = run_suite(args)
+    regressions = compare(baseline, current, args.threshold)
+    for line in regressions:
+        print("REGRESSION", line)
+    if not regressions:
+        print("no regressions above {:.0%}".format(args.threshold))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
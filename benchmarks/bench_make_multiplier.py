@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Throughput of make_multiplier: one call per element with the original
+closure versus one batched call on a list or array('d'), with and
+without in_place, and a folded chain of three multipliers.
+
+Usage: ./benchmarks/bench_make_multiplier.py [n ...]
+"""
+import os
+import sys
+import timeit
+from array import array
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '0x00-python_variable_annotations'))
+make_multiplier = __import__('8-make_multiplier').make_multiplier
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def closure(multiplier: float):
+    """The original per-element closure returned by make_multiplier."""
+    def multiplier_function(value: float) -> float:
+        return value * multiplier
+    return multiplier_function
+
+
+def main(sizes: List[int]) -> None:
+    """Print millions of elements per second for each variant."""
+    double = make_multiplier(2.0)
+    chain = make_multiplier(2.0).compose(
+        make_multiplier(0.5)).compose(make_multiplier(3.0))
+    per_element = closure(2.0)
+    variants = {
+        "closure": lambda data, typed: [per_element(x) for x in data],
+        "closure x3": lambda data, typed: [
+            per_element(per_element(per_element(x))) for x in data],
+        "list": lambda data, typed: double(data),
+        "array": lambda data, typed: double(typed),
+        "array inplace": lambda data, typed: double(typed, in_place=True),
+        "folded x3": lambda data, typed: chain(typed),
+    }
+    print(f"{'n':>9} " + " ".join(f"{name:>13}" for name in variants))
+    for n in sizes:
+        data = [float(i) for i in range(n)]
+        typed = array('d', data)
+        number = max(1, 1_000_000 // n)
+        cells = []
+        for variant in variants.values():
+            best = min(timeit.repeat(lambda: variant(data, typed),
+                                     number=number, repeat=3))
+            cells.append(f"{n * number / best / 1e6:13.2f}")
+        print(f"{n:>9} " + " ".join(cells), flush=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
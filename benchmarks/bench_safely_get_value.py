@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk lookups: a loop over safely_get_value against
+safely_get_values (list and lazy), on a dict and on a FrozenDict.
+Half of the looked-up keys are missing.
+
+Usage: ./benchmarks/bench_safely_get_value.py [n ...]
+"""
+import os
+import sys
+import timeit
+from collections import deque
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '0x00-python_variable_annotations'))
+module = __import__('101-safely_get_value')
+safely_get_value = module.safely_get_value
+safely_get_values = module.safely_get_values
+FrozenDict = module.FrozenDict
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+def main(sizes: List[int]) -> None:
+    """Print millions of lookups per second for each variant."""
+    variants = {
+        "loop": lambda dct, keys: [safely_get_value(dct, key)
+                                   for key in keys],
+        "bulk list": lambda dct, keys: safely_get_values(dct, keys),
+        "bulk lazy": lambda dct, keys: deque(
+            safely_get_values(dct, keys, lazy=True), maxlen=0),
+    }
+    print(f"{'n':>9} {'mapping':>10} " +
+          " ".join(f"{name:>10}" for name in variants))
+    for n in sizes:
+        data = {f"key{i}": i for i in range(n)}
+        keys = [f"key{i}" for i in range(0, 2 * n, 2)]
+        number = max(1, 1_000_000 // n)
+        for name, dct in (("dict", data), ("FrozenDict", FrozenDict(data))):
+            cells = []
+            for variant in variants.values():
+                best = min(timeit.repeat(lambda: variant(dct, keys),
+                                         number=number, repeat=3))
+                cells.append(f"{n * number / best / 1e6:10.2f}")
+            print(f"{n:>9} {name:>10} " + " ".join(cells), flush=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
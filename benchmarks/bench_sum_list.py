@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark matrix for sum_list across input types, sizes and modes.
+
+Input types are list, array('d'), memoryview and, when installed, a
+NumPy array. Modes are the default sum, exact (math.fsum) and the
+chunked threaded path.
+
+Usage: ./benchmarks/bench_sum_list.py [n ...]
+"""
+import os
+import random
+import sys
+import timeit
+from array import array
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '0x00-python_variable_annotations'))
+sum_list = __import__('5-sum_list').sum_list
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SIZES = [1_000, 100_000, 1_000_000, 10_000_000]
+MODES = {
+    "default": {},
+    "exact": {"exact": True},
+    "workers=4": {"workers": 4},
+}
+
+
+def inputs(n: int) -> Dict[str, Any]:
+    """Builds the same n random floats as each input type."""
+    values = [random.random() for _ in range(n)]
+    typed = array('d', values)
+    built = {"list": values, "array": typed, "memoryview": memoryview(typed)}
+    if numpy is not None:
+        built["numpy"] = numpy.array(values)
+    return built
+
+
+def main(sizes: List[int]) -> None:
+    """Print the best-of-3 time in ms for every type/size/mode cell."""
+    print(f"{'n':>10} {'type':>10} " +
+          " ".join(f"{mode:>10}" for mode in MODES))
+    for n in sizes:
+        number = max(1, 1_000_000 // n)
+        for name, data in inputs(n).items():
+            cells = []
+            for kwargs in MODES.values():
+                best = min(timeit.repeat(lambda: sum_list(data, **kwargs),
+                                         number=number, repeat=3))
+                cells.append(f"{best / number * 1e3:10.3f}")
+            print(f"{n:>10} {name:>10} {' '.join(cells)}", flush=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
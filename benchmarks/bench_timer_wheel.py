@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Compare asyncio.sleep with the timer-wheel wheel_sleep for large
+numbers of concurrent wait_random sleepers.
+
+Every configuration runs in a fresh subprocess, so the peak RSS it
+reports belongs to that configuration alone. CPU time is process
+time, which leaves out the time spent idle while sleeping.
+
+Usage: ./benchmarks/bench_timer_wheel.py [n ...]
+"""
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import time
+from importlib import import_module
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '0x01-python_async_function'))
+
+SIZES = [10_000, 100_000, 1_000_000]
+MAX_DELAY = 2
+
+
+def child(primitive: str, n: int) -> None:
+    """Runs n sleepers with the given primitive and prints cpu and RSS."""
+    wait_random = import_module('0-basic_async_syntax').wait_random
+    sleep = (import_module('10-timer_wheel').wheel_sleep
+             if primitive == "wheel" else asyncio.sleep)
+
+    async def run() -> None:
+        await asyncio.gather(*(wait_random(MAX_DELAY, sleep)
+                               for _ in range(n)))
+
+    start = time.process_time()
+    asyncio.run(run())
+    cpu = time.process_time() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{cpu:.4f} {rss:.1f}")
+
+
+def main(sizes: List[int]) -> None:
+    """Print cpu seconds and peak RSS (MiB) for each primitive."""
+    print(f"{'n':>10} {'sleep cpu':>10} {'sleep MiB':>10} "
+          f"{'wheel cpu':>10} {'wheel MiB':>10}")
+    for n in sizes:
+        row = []
+        for primitive in ("asyncio", "wheel"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", primitive, str(n)],
+                check=True, capture_output=True, text=True).stdout.split()
+            row.append(f"{float(out[0]):10.4f} {float(out[1]):10.1f}")
+        print(f"{n:>10} {' '.join(row)}", flush=True)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main([int(arg) for arg in sys.argv[1:]] or SIZES)
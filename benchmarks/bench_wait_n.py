@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Benchmark the scaling of wait_n and task_wait_n from 10 to 1M coroutines.
+
+max_delay is 0 so the numbers measure scheduling and ordering overhead
+rather than time spent sleeping. The old min()/remove() ordering is only
+run for small n since it is quadratic.
+
+Usage: ./benchmarks/bench_wait_n.py [n ...]
+"""
+import asyncio
+import os
+import sys
+import time
+from importlib import import_module
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '0x01-python_async_function'))
+wait_random = import_module('0-basic_async_syntax').wait_random
+wait_n = import_module('1-concurrent_coroutines').wait_n
+task_wait_n = import_module('4-tasks').task_wait_n
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+QUADRATIC_LIMIT = 10_000
+
+
+async def legacy_wait_n(n: int, max_delay: int) -> List[float]:
+    """The original gather + min()/remove() implementation of wait_n."""
+    delays = await asyncio.gather(*(wait_random(max_delay) for _ in range(n)))
+    sorted_delays = []
+    while delays:
+        min_delay = min(delays)
+        sorted_delays.append(min_delay)
+        delays.remove(min_delay)
+    return sorted_delays
+
+
+def timed(coro) -> float:
+    """Run coro on a fresh event loop and return the elapsed seconds."""
+    start = time.perf_counter()
+    asyncio.run(coro)
+    return time.perf_counter() - start
+
+
+def main(sizes: List[int]) -> None:
+    """Print one row per size with the runtime of each variant."""
+    print(f"{'n':>10} {'legacy':>10} {'wait_n':>10} {'task_wait_n':>12}")
+    for n in sizes:
+        legacy = (f"{timed(legacy_wait_n(n, 0)):10.4f}"
+                  if n <= QUADRATIC_LIMIT else f"{'-':>10}")
+        print(f"{n:>10} {legacy} {timed(wait_n(n, 0)):10.4f} "
+              f"{timed(task_wait_n(n, 0)):12.4f}", flush=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
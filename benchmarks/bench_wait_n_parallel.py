@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark wait_n_parallel against the single-loop wait_n.
+
+max_delay is 0 so the numbers measure per-coroutine overhead, which is
+the part that the process pool spreads over several cores.
+
+Usage: ./benchmarks/bench_wait_n_parallel.py [n ...]
+"""
+import asyncio
+import os
+import sys
+import time
+from importlib import import_module
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '0x01-python_async_function'))
+wait_n = import_module('1-concurrent_coroutines').wait_n
+wait_n_parallel = import_module('7-wait_n_parallel').wait_n_parallel
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def timed(coro) -> float:
+    """Run coro on a fresh event loop and return the elapsed seconds."""
+    start = time.perf_counter()
+    asyncio.run(coro)
+    return time.perf_counter() - start
+
+
+def main(sizes: List[int]) -> None:
+    """Print one row per size for wait_n and each worker count."""
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    header = " ".join(f"{'workers=' + str(w):>10}" for w in counts)
+    print(f"{'n':>10} {'wait_n':>10} {header}")
+    for n in sizes:
+        row = " ".join(f"{timed(wait_n_parallel(n, 0, w)):10.4f}"
+                       for w in counts)
+        print(f"{n:>10} {timed(wait_n(n, 0)):10.4f} {row}", flush=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compare time and peak traced memory of the zoom_array variants.
+
+Each variant produces and consumes every zoomed element once. Memory
+is the tracemalloc peak during that pass, excluding the input.
+
+Usage: ./benchmarks/bench_zoom_array.py [n ...]
+"""
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from typing import Any, Callable, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..', '0x00-python_variable_annotations'))
+zoom = __import__('102-type_checking')
+
+SIZES = [1_000, 100_000, 1_000_000]
+FACTOR = 30
+
+
+def consume(items: Any) -> None:
+    """Iterates items once without keeping them."""
+    deque(items, maxlen=0)
+
+
+VARIANTS = {
+    "zoom_array": lambda lst, typed: consume(zoom.zoom_array(lst, FACTOR)),
+    "ZoomView": lambda lst, typed: consume(zoom.ZoomView(lst, FACTOR)),
+    "zoom_iter": lambda lst, typed: consume(zoom.zoom_iter(lst, FACTOR)),
+    "zoom_chunks": lambda lst, typed: consume(
+        zoom.zoom_chunks(lst, FACTOR)),
+    "typed_array": lambda lst, typed: len(
+        zoom.zoom_typed_array(typed, FACTOR)),
+}
+
+
+def measure(variant: Callable[[List[int], array], Any], lst: List[int],
+            typed: array) -> str:
+    """Returns 'seconds MiB' for one run of variant."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    variant(lst, typed)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return f"{elapsed:8.3f}s {peak / 2 ** 20:8.1f}M"
+
+
+def main(sizes: List[int]) -> None:
+    """Print one row per size with time and peak memory per variant."""
+    print(f"{'n':>9} " + " ".join(f"{name:>18}" for name in VARIANTS))
+    for n in sizes:
+        lst = list(range(n))
+        typed = array('q', lst)
+        cells = [measure(variant, lst, typed) for variant in VARIANTS.values()]
+        print(f"{n:>9} " + " ".join(cells), flush=True)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)